@@ -10,57 +10,92 @@ audioStream = None
 
 audioDevices = {}
 
+# Common sample rates to check audio devices for.
+AUDIO_SAMPLE_RATES = (8000, 22050, 44100, 48000, 96000)
+
+# Cache of valid sample rates for each audio device index, as querying PortAudio can be slow.
+audioSampleRates = {}
+
 
 def init_audio(widgets):
     """ Initialise pyaudio object, and populate list of sound card in GUI """
-    global pyAudio, audioDevices
+    global pyAudio, audioDevices, audioSampleRates
 
     # Init PyAudio
     pyAudio = pyaudio.PyAudio()
     audioDevices = {}
+    audioSampleRates = {}
 
-    # Clear list
-    widgets["audioDeviceSelector"].clear()
-    # Add in the 'dummy' GQRX UDP interface
-    widgets["audioDeviceSelector"].addItem('UDP Audio (127.0.0.1:7355)')
-    
-    
-    # Get list of Host APIs
-    _host_apis = []
+    # List of device names, starting with the 'dummy' GQRX UDP interface
+    _device_names = ['UDP Audio (127.0.0.1:7355)']
+
+    # Get names of the Host APIs, shortening them a little.
+    _host_apis = {}
     for y in range(0, pyAudio.get_host_api_count()):
-        _hapi = pyAudio.get_host_api_info_by_index(y)['name']
-        
-        # Shorten the Host API name a little.
-        if 'Windows ' in _hapi:
-            _host_apis.append(_hapi.replace("Windows ",""))
-        else:
-            _host_apis.append(_hapi)
+        _host_apis[y] = pyAudio.get_host_api_info_by_index(y)['name'].replace("Windows ", "")
 
     # Iterate through PyAudio devices
     for x in range(0, pyAudio.get_device_count()):
         _dev = pyAudio.get_device_info_by_index(x)
 
-        # Does the device have inputs?
-        if _dev["maxInputChannels"] > 0:
-            _hapi = _dev['hostApi']
-            # Get the name
-            _name = _dev["name"] + " (" + _host_apis[_hapi] + ")"
-            # Add to local store of device info
-            audioDevices[_name] = _dev
-            # Add to audio device selection list.
-            widgets["audioDeviceSelector"].addItem(_name)
-            logging.debug(f"Found audio device: {_name}")
+        # Skip devices without inputs.
+        if _dev["maxInputChannels"] <= 0:
+            continue
+
+        # Get the name
+        _name = _dev["name"] + " (" + _host_apis.get(_dev['hostApi'], "Unknown") + ")"
+        # Add to local store of device info
+        audioDevices[_name] = _dev
+        # Add to audio device selection list.
+        _device_names.append(_name)
+        logging.debug("Found audio device: %s", _name)
+
+    # Populate the device selector in one go. Signals are blocked while doing this, to avoid
+    # the sample rate list being re-populated (which queries the audio device) for every change.
+    widgets["audioDeviceSelector"].blockSignals(True)
+    widgets["audioDeviceSelector"].clear()
+    widgets["audioDeviceSelector"].addItems(_device_names)
 
     # Select first item.
     if len(list(audioDevices.keys())) > 0:
         widgets["audioDeviceSelector"].setCurrentIndex(0)
 
+    widgets["audioDeviceSelector"].blockSignals(False)
+
     # Initial population of sample rates.
     populate_sample_rates(widgets)
 
     return audioDevices
 
 
+def get_valid_sample_rates(dev_info):
+    """ Determine which sample rates from a common list are valid for an audio device. Results are cached per-device. """
+    global audioSampleRates, pyAudio
+
+    if dev_info['index'] in audioSampleRates:
+        return audioSampleRates[dev_info['index']]
+
+    _valid_rates = []
+    for _rate in AUDIO_SAMPLE_RATES:
+        try:
+            _valid = pyAudio.is_format_supported(
+                float(_rate),
+                input_device=dev_info['index'],
+                input_channels=1,
+                input_format=pyaudio.paInt16
+            )
+        except ValueError:
+            # Why oh why do you throw an exception instead of returning FALSE pyaudio...
+            _valid = False
+
+        if _valid:
+            _valid_rates.append(str(_rate))
+
+    audioSampleRates[dev_info['index']] = _valid_rates
+
+    return _valid_rates
+
+
 def populate_sample_rates(widgets):
     """ Populate the sample rate ComboBox with the sample rates of the currently selected audio device """
     global audioDevices, pyAudio
@@ -80,26 +115,8 @@ def populate_sample_rates(widgets):
         return
 
     if _dev_name in audioDevices:
-        # Determine which sample rates from a common list are valid for this device.
-        _possible_rates = [8000.0, 22050.0, 44100.0, 48000.0, 96000.0]
-        _valid_rates = []
-        for _rate in _possible_rates:
-            _dev_info = audioDevices[_dev_name]
-            _valid = False
-            try:
-                _valid = pyAudio.is_format_supported(
-                    _rate,
-                    input_device=_dev_info['index'],
-                    input_channels=1,
-                    input_format=pyaudio.paInt16
-                )
-            except ValueError:
-                # Why oh why do you throw an exception instead of returning FALSE pyaudio...
-                _valid = False
-            
-            if _valid:
-                widgets["audioSampleRateSelector"].addItem(str(int(_rate)))
-                _valid_rates.append(str(int(_rate)))
+        _valid_rates = get_valid_sample_rates(audioDevices[_dev_name])
+        widgets["audioSampleRateSelector"].addItems(_valid_rates)
 
         # Use 48 kHz sample rate if the sound card supports it.
         if "48000" in _valid_rates: 
@@ -128,7 +145,11 @@ class AudioStream(object):
 
         self.audio_thread_running = True
 
-        self.audio = pyaudio.PyAudio()
+        # Re-use the global PyAudio object if it has already been initialised by init_audio.
+        if pyAudio is None:
+            self.audio = pyaudio.PyAudio()
+        else:
+            self.audio = pyAudio
         
     def start_stream(self, info_callback=None):
         if info_callback:
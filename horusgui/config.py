@@ -14,6 +14,21 @@ from .audio import populate_sample_rates
 from horusdemodlib.payloads import download_latest_payload_id_list, download_latest_custom_field_list, read_payload_list, read_custom_field_list
 import horusdemodlib.payloads
 
+# Use orjson for (de)serialising the payload lists if it is available, as it is much faster than json.
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(data):
+        # Payload list keys are ints, which orjson needs to be told to accept.
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 default_config = {
     "version": __version__,
     "audio_device": "None",
@@ -35,16 +50,19 @@ default_config = {
     "rotator_host": "localhost",
     "rotator_port": 4533,
     "rotator_rangeinhibit": True,
+    "rotator_threshold": 0.5,
     "logging_enabled": False,
     "log_format": "CSV",
     "log_directory": "",
     "fft_smoothing": False,
-    "payload_list": json.dumps(horusdemodlib.payloads.HORUS_PAYLOAD_LIST),
-    "custom_field_list": json.dumps({})
 }
 
 qt_settings = QtCore.QSettings("Project Horus", "Horus-GUI")
 
+# The payload ID and custom field lists are cached as JSON files, rather than stored in QSettings.
+PAYLOAD_LIST_CACHE = "payload_list.json"
+CUSTOM_FIELD_LIST_CACHE = "custom_field_list.json"
+
 def ValueToBool(Value):
     """ Helper function to deal with QSettings inconsistency in handling boolean values """
     if isinstance(Value, bool):
@@ -62,14 +80,73 @@ def ValueToBool(Value):
     return RetVal
 
 
+def get_cache_path(filename):
+    """ Get the path to a cache file within the application data directory """
+    _data_dir = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(_data_dir, "Project Horus", "Horus-GUI", filename)
+
+
+def write_list_cache(filename, data):
+    """ Write a payload or custom field list out to a cache file """
+    _path = get_cache_path(filename)
+
+    try:
+        os.makedirs(os.path.dirname(_path), exist_ok=True)
+        with open(_path, 'w') as _f:
+            _f.write(json_dumps(data))
+    except Exception as e:
+        logging.error(f"Could not write cache file {_path} - {str(e)}")
+
+
+def read_list_cache(filename):
+    """ Read a payload or custom field list from a cache file. Returns None if the cache is not available. """
+    _path = get_cache_path(filename)
+
+    try:
+        with open(_path, 'r') as _f:
+            return json_loads(_f.read())
+    except Exception as e:
+        logging.debug("Could not read cache file %s - %s", _path, str(e))
+        return None
+
+
+def clear_list_caches():
+    """ Remove the payload and custom field list cache files """
+    for _filename in (PAYLOAD_LIST_CACHE, CUSTOM_FIELD_LIST_CACHE):
+        _path = get_cache_path(_filename)
+        try:
+            if os.path.exists(_path):
+                os.remove(_path)
+        except Exception as e:
+            logging.error(f"Could not remove cache file {_path} - {str(e)}")
+
+
+def read_payload_list_cache():
+    """ Read the payload ID list from the local cache """
+    _payloads = read_list_cache(PAYLOAD_LIST_CACHE)
+
+    if _payloads is None:
+        return None
+
+    # JSON converts the int dictionary keys into strings... annoying!
+    _temp = {}
+    for _key in _payloads:
+        _temp[int(_key)] = _payloads[_key]
+
+    return _temp
+
+
 def write_config():
     """ Write global settings into QSettings """
     global default_config, qt_settings
 
-    # Write all settings
+    # Write all settings. QSettings holds these in memory until they are synced.
     for _setting in default_config:
         qt_settings.setValue(_setting, default_config[_setting])
-    
+
+    # Flush all settings to the backing store (registry/plist/ini file) in one go.
+    qt_settings.sync()
+
     logging.info("Current configuration saved.")
 
 
@@ -91,7 +168,7 @@ def read_config(widgets):
             if _new_setting is not None:
                 default_config[_setting] = _new_setting
         except Exception as e:
-            logging.debug("Missing config setting: " + _setting)
+            logging.debug("Missing config setting: %s", _setting)
 
     if widgets:
         # Habitat Settings
@@ -127,6 +204,7 @@ def read_config(widgets):
         widgets["rotatorHostEntry"].setText(str(default_config["rotator_host"]))
         widgets["rotatorPortEntry"].setText(str(default_config["rotator_port"]))
         widgets["rotatorRangeInhibit"].setChecked(ValueToBool(default_config["rotator_rangeinhibit"]))
+        widgets["rotatorThresholdEntry"].setText(str(default_config["rotator_threshold"]))
 
         # Logging Settings
         widgets["loggingPathEntry"].setText(str(default_config["log_directory"]))
@@ -139,14 +217,18 @@ def read_config(widgets):
             widgets["horusModemRateSelector"].setCurrentText(str(default_config['baud_rate']))
 
 
-    if 'payload_list' in default_config:
-        _payloads = json.loads(default_config['payload_list'])
-        # JSON converts the int dictionary keys into strings... annoying!
-        _temp = {}
-        for _key in _payloads:
-            _temp[int(_key)] = _payloads[_key]
-        
-        default_config['payload_list'] = _temp
+    # Older versions stored the payload and custom field lists in QSettings.
+    # Move these out to the cache files, and remove them from QSettings.
+    for _setting, _filename in [('payload_list', PAYLOAD_LIST_CACHE), ('custom_field_list', CUSTOM_FIELD_LIST_CACHE)]:
+        _legacy = qt_settings.value(_setting)
+        if _legacy is not None:
+            try:
+                if read_list_cache(_filename) is None:
+                    write_list_cache(_filename, json_loads(_legacy))
+            except Exception as e:
+                logging.debug("Could not migrate stored %s - %s", _setting, str(e))
+
+            qt_settings.remove(_setting)
 
 
 
@@ -179,17 +261,23 @@ def save_config(widgets):
         default_config["rotator_host"] = widgets["rotatorHostEntry"].text()
         default_config["rotator_port"] = int(widgets["rotatorPortEntry"].text())
         default_config["rotator_rangeinhibit"] = widgets["rotatorRangeInhibit"].isChecked()
+        try:
+            default_config["rotator_threshold"] = float(widgets["rotatorThresholdEntry"].text())
+        except ValueError:
+            # Leave the existing threshold setting if the entry has been left empty.
+            pass
         default_config["logging_enabled"] = widgets["enableLoggingSelector"].isChecked()
         default_config["log_directory"] = widgets["loggingPathEntry"].text()
         default_config["log_format"] = widgets["loggingFormatSelector"].currentText()
         default_config["fft_smoothing"] = widgets["fftSmoothingSelector"].isChecked()
 
-        default_config["payload_list"] = json.dumps(horusdemodlib.payloads.HORUS_PAYLOAD_LIST)
-        default_config["custom_field_list"] = json.dumps(horusdemodlib.payloads.HORUS_CUSTOM_FIELDS)
-
         # Write out to config file
         write_config()
 
+        # Update local cache of the payload and custom field lists.
+        write_list_cache(PAYLOAD_LIST_CACHE, horusdemodlib.payloads.HORUS_PAYLOAD_LIST)
+        write_list_cache(CUSTOM_FIELD_LIST_CACHE, horusdemodlib.payloads.HORUS_CUSTOM_FIELDS)
+
 
 def init_payloads(payload_id_list=None, custom_field_list=None):
     """ Attempt to download the latest payload / config data, and update local configs """
@@ -210,10 +298,10 @@ def init_payloads(payload_id_list=None, custom_field_list=None):
         else:
             logging.critical("Could not read payload list!")
     else:
-        if 'payload_list' in default_config:
-            # Maybe we have a stored config we can use.
+        # Maybe we have a stored config we can use.
+        _payload_list = read_payload_list_cache()
+        if _payload_list is not None:
             try:
-                _payload_list = default_config['payload_list']
                 if 0 in _payload_list:
                     horusdemodlib.payloads.HORUS_PAYLOAD_LIST = _payload_list
                     logging.warning(f"Loaded Payload List from local cache, may be out of date!")
@@ -240,10 +328,10 @@ def init_payloads(payload_id_list=None, custom_field_list=None):
         else:
             logging.critical("Could not read custom field list!")
     else:
-        if 'custom_field_list' in default_config:
-            # Maybe we have a stored config we can use.
+        # Maybe we have a stored config we can use.
+        _custom_fields = read_list_cache(CUSTOM_FIELD_LIST_CACHE)
+        if _custom_fields is not None:
             try:
-                _custom_fields = json.loads(default_config['custom_field_list'])
                 if '4FSKTEST-V2' in _custom_fields:
                     horusdemodlib.payloads.HORUS_CUSTOM_FIELDS = _custom_fields
                     logging.warning("Loaded Custom Fields List from local cache, may be out of date!")
@@ -1,11 +1,23 @@
 # FFT
+import functools
 import logging
-import time
 import numpy as np
-from queue import Queue
+from threading import Event
 #from threading import Thread
 
 
+# Lower limit on FFT bin power, in dB. This keeps the output finite (no log10(0) -> -inf, or NaNs on silence).
+FFT_FLOOR_DB = -200.0
+
+
+@functools.lru_cache(maxsize=4)
+def hanning_window(nfft):
+    """ Return a (read-only) float32 Hann window. These are cached, as the same NFFT is used on every restart. """
+    _window = np.hanning(nfft).astype(np.float32)
+    _window.flags.writeable = False
+    return _window
+
+
 class FFTProcess(object):
     """ Process an incoming stream of samples, and calculate FFTs """
 
@@ -29,11 +41,15 @@ class FFTProcess(object):
 
         self.callback = callback
 
-        self.sample_buffer = bytearray(b"")
+        # Most recent FFT update. This is replaced (never modified) on each update, so it can be
+        # polled from another thread without locking.
+        self.latest_update = None
 
-        self.input_queue = Queue(512)
+        # Set by the audio thread whenever new samples have been written into the ring buffer.
+        self.samples_available = Event()
 
         self.init_window()
+        self.init_buffer()
 
         self.processing_thread_running = True
 
@@ -42,74 +58,155 @@ class FFTProcess(object):
 
     def init_window(self):
         """ Initialise Window functions and FFT scales. """
-        self.window = np.hanning(self.nfft)
-        self.fft_scale = np.fft.fftshift(np.fft.fftfreq(self.nfft)) * self.fs
-        self.mask = (self.fft_scale > self.range[0]) & (self.fft_scale < self.range[1])
+        # Audio is 16-bit PCM, so single precision is plenty for a display FFT.
+        self.window = hanning_window(self.nfft)
+        self.sample_scale = np.float32(1.0 / (2 ** 15))
+        # Full-scale level of a 16-bit sample, in dB.
+        self.full_scale_offset = np.float32(20 * np.log10(2 ** 15))
+        # Window with the int16 -> float scaling and the 1/NFFT FFT normalisation folded in,
+        # so conversion, windowing and normalisation are all one pass.
+        self.sample_window = self.window * (self.sample_scale / np.float32(self.nfft))
+        self.fft_floor = np.float32(10 ** (FFT_FLOOR_DB / 10))
+        # Scratch buffer for the windowed FFT input.
+        self.fft_input = np.zeros(self.nfft, dtype=np.float32)
+        # Input samples are real, so only the positive half of the spectrum is calculated.
+        self.fft_scale = np.fft.rfftfreq(self.nfft, d=1.0 / self.fs).astype(np.float32)
+        # Index range of the FFT bins within the display range. These are contiguous, so can be sliced directly.
+        self.range_start = int(np.searchsorted(self.fft_scale, self.range[0], side="right"))
+        self.range_end = int(np.searchsorted(self.fft_scale, self.range[1], side="left"))
+        self.range_scale = self.fft_scale[self.range_start : self.range_end]
+
+    def init_buffer(self):
+        """ Initialise the circular sample buffer. """
+        # The ring is written to by the audio thread (add_samples), and read by the FFT processing thread.
+        # Each thread only ever advances its own position, so no locking is required.
+        # Read/write positions are absolute sample counts, and are wrapped onto the ring on access.
+        self.ring_size = self.nfft * 16
+        # The first NFFT samples of the ring are mirrored past its end, so that a FFT block
+        # can always be read out as a contiguous view, even when it wraps around.
+        self.ring = np.zeros(self.ring_size + self.nfft, dtype=np.int16)
+        self.ring_read = 0
+        self.ring_write = 0
+        # Trailing byte of a block which ended part way through a sample, carried over to the next block.
+        self.partial_sample = b""
+
+    def ring_samples(self):
+        """ Return the number of samples currently held in the ring buffer """
+        return self.ring_write - self.ring_read
+
+    def ring_put(self, samples):
+        """ Copy an array of samples into the ring buffer. The caller must ensure there is space. """
+        _pos = self.ring_write % self.ring_size
+        _first = min(len(samples), self.ring_size - _pos)
+        _wrapped = len(samples) - _first
+        self.ring[_pos : _pos + _first] = samples[:_first]
+        self.ring[:_wrapped] = samples[_first:]
+
+        # Update the mirrored region, if we have written to the start of the ring.
+        if _pos < self.nfft:
+            _end = min(_pos + _first, self.nfft)
+            self.ring[self.ring_size + _pos : self.ring_size + _end] = self.ring[_pos:_end]
+        if _wrapped > 0:
+            _end = min(_wrapped, self.nfft)
+            self.ring[self.ring_size : self.ring_size + _end] = self.ring[:_end]
+
+        self.ring_write += len(samples)
+
+    def ring_get(self):
+        """ Return a view of the next NFFT samples in the ring buffer """
+        _pos = self.ring_read % self.ring_size
+        return self.ring[_pos : _pos + self.nfft]
 
     def perform_fft(self):
         """ Perform a FFT on the first NFFT samples in the sample buffer, then shift the buffer along """
 
-        # Convert raw data to floats.
-        raw_data = np.fromstring(
-            bytes(self.sample_buffer[: self.nfft * self.sample_width]), dtype=np.int16
-        )
-        raw_data = raw_data.astype(np.float64) / (2 ** 15)
-
-        # Advance sample buffer
-        self.sample_buffer = self.sample_buffer[self.stride * self.sample_width :]
+        _samples = self.ring_get()
 
-        # Calculate Maximum value
-        _raw_max = raw_data.max()
+        # Calculate Maximum value. This is done on the raw int16 samples, which is a cheaper reduction than on floats,
+        # and lets us skip the conversion and FFT entirely if there is no signal.
+        _raw_max = _samples.max()
         if(_raw_max>0):
+            # Convert to floats and apply the window in a single pass.
+            np.multiply(_samples, self.sample_window, out=self.fft_input)
+
             # Calculate FFT
-            _fft = 20 * np.log10(
-                np.abs(np.fft.fftshift(np.fft.fft(raw_data * self.window)))
-            ) - 20 * np.log10(self.nfft)
+            _spectrum = np.fft.rfft(self.fft_input)[self.range_start : self.range_end]
+
+            # Convert to dB from the magnitude squared, working in-place to avoid temporary arrays.
+            # Older NumPy versions return a complex128 FFT even for float32 input, so the power is
+            # explicitly calculated as float32 to keep the output (and everything downstream) single precision.
+            _fft = np.square(_spectrum.real, dtype=np.float32)
+            _fft += np.square(_spectrum.imag, dtype=np.float32)
+            np.maximum(_fft, self.fft_floor, out=_fft)
+            np.log10(_fft, out=_fft)
+            _fft *= 10
 
             # Calculate dBFS value.
-            _dbfs = 20*np.log10(_raw_max)
+            _dbfs = 20*np.log10(_raw_max, dtype=np.float32) - self.full_scale_offset
         else:
-            _fft = np.zeros(self.nfft)*np.nan
+            _fft = np.full(len(self.range_scale), FFT_FLOOR_DB, dtype=np.float32)
             _dbfs = -99.0
 
-        if self.callback != None:
-            if self.update_counter % self.update_decimation == 0:
-                self.callback.emit({"fft": _fft[self.mask], "scale": self.fft_scale[self.mask], 'dbfs': _dbfs})
-                
-            self.update_counter += 1
+        # Advance sample buffer. This is only done once we have finished with the samples,
+        # as it frees up this area of the ring to be overwritten.
+        self.ring_read += self.stride
 
-    def process_block(self, samples):
-        """ Add a block of samples to the input buffer. Calculate and process FFTs if the buffer is big enough """
+        if self.update_counter % self.update_decimation == 0:
+            # The peak level is also calculated here, so the GUI thread doesn't have to scan the spectrum.
+            self.latest_update = {"fft": _fft, "scale": self.range_scale, 'dbfs': _dbfs, "fft_max": float(_fft.max())}
 
-        self.sample_buffer.extend(samples)
+            if self.callback != None:
+                self.callback.emit(self.latest_update)
 
-        while len(self.sample_buffer) > self.nfft * self.sample_width:
-            self.perform_fft()
+        self.update_counter += 1
 
     def processing_thread(self, info_callback=None):
-        if info_callback:
-            self.callback = info_callback
+        """ Process FFTs as samples arrive. Results are published via latest_update, so info_callback is not used. """
 
         while self.processing_thread_running:
-            if self.input_queue.qsize() > 0:
-                data = self.input_queue.get()
-                self.process_block(data)
-            else:
-                time.sleep(0.01)
+            # Block until the audio thread has added samples, or we are being stopped.
+            self.samples_available.wait()
+            self.samples_available.clear()
+
+            while self.ring_samples() >= self.nfft:
+                if self.callback is None:
+                    # Only the latest update is used, so if we have fallen behind, skip straight to the
+                    # newest complete frame rather than calculating FFTs which will never be displayed.
+                    _skip = (self.ring_samples() - self.nfft) // self.stride
+                    self.ring_read += _skip * self.stride
+                    self.update_counter += _skip
+
+                self.perform_fft()
 
         logging.debug("Stopped FFT processing thread")
 
     def add_samples(self, samples):
-        """ Add a block of samples to the input queue """
-        try:
-            self.input_queue.put_nowait(samples)
-        except:
+        """ Add a block of samples to the ring buffer, and wake up the processing thread """
+        # Blocks (e.g. UDP datagrams) are not guaranteed to contain a whole number of samples,
+        # so carry any odd trailing byte over to the next block.
+        if self.partial_sample or (len(samples) % 2):
+            samples = self.partial_sample + bytes(samples)
+            _length = len(samples) - (len(samples) % 2)
+            self.partial_sample = samples[_length:]
+            samples = samples[:_length]
+
+        _samples = np.frombuffer(samples, dtype=np.int16)
+
+        if len(_samples) > self.ring_size - self.ring_samples():
             logging.error("Input overrun!")
+            return
+
+        self.ring_put(_samples)
+        self.samples_available.set()
 
     def flush(self):
         """ Clear the sample buffer """
-        self.sample_buffer = bytearray(b"")
+        self.ring_read = 0
+        self.ring_write = 0
+        self.partial_sample = b""
 
     def stop(self):
         """ Halt processing """
         self.processing_thread_running = False
+        # Wake up the processing thread so it can exit.
+        self.samples_available.set()
@@ -14,11 +14,13 @@ if sys.version_info < (3, 0):
     sys.exit(1)
 
 import argparse
-import datetime
+import importlib.util
 # import glob
 import logging
 import platform
 import time
+import traceback
+from collections import deque
 import pyqtgraph as pg
 import numpy as np
 from PyQt6.QtWidgets import *
@@ -49,6 +51,7 @@ parser.add_argument("--payload-id-list", type=str, default=None, help="Use suppl
 parser.add_argument("--custom-field-list", type=str, default=None, help="Use supplied Custom Field List instead of downloading a new one.")
 parser.add_argument("--libfix", action="store_true", default=False, help="Search for libhorus.dll/so in ./ instead of on the path.")
 parser.add_argument("--reset", action="store_true", default=False, help="Reset all configuration information on startup.")
+parser.add_argument("--opengl", action="store_true", default=False, help="Use OpenGL to draw the spectrum and SNR plots (requires PyOpenGL).")
 parser.add_argument("-v", "--verbose", action="store_true", default=False, help="Verbose output (set logging level to DEBUG)")
 args = parser.parse_args()
 
@@ -70,6 +73,25 @@ else:
 
 PEN_WIDTH=1
 
+# Optionally draw plots using OpenGL. This is off by default, as it depends on PyOpenGL and driver support.
+if args.opengl:
+    if importlib.util.find_spec("OpenGL") is not None:
+        pg.setConfigOptions(useOpenGL=True)
+    else:
+        logging.error("PyOpenGL is not installed, not using OpenGL for plots.")
+
+# Spectrum/SNR plot redraw interval (ms)
+PLOT_UPDATE_INTERVAL = 50
+
+# Last packet age update interval (ms)
+DECODED_AGE_UPDATE_INTERVAL = 500
+
+# Console update interval (ms)
+CONSOLE_UPDATE_INTERVAL = 100
+
+# Number of SNR samples kept for the SNR plot (~100 seconds at 2 Hz)
+SNR_HISTORY_LENGTH = 200
+
 # Establish signals and worker for multi-threaded use
 class WorkerSignals(QObject):
     # finished = pyqtSignal()
@@ -93,9 +115,11 @@ class Worker(QRunnable):
         try:
             result = self.fn(*self.args, **self.kwargs)
         except:
-            traceback.print_exc()
+            # Format the traceback once, and use it for both the log and the error signal.
             exctype, value = sys.exc_info()[:2]
-            self.signals.error.emit((exctype, value, traceback.format_exc()))
+            _traceback = traceback.format_exc()
+            logging.error("Worker thread raised an exception:\n%s", _traceback)
+            self.signals.error.emit((exctype, value, _traceback))
         # else:
         #     self.signals.result.emit(result)
         # finally:
@@ -110,6 +134,13 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def decimal_validator(bottom, top):
+    """ Create a validator for decimal entries, which always uses '.' as the decimal separator """
+    _validator = QDoubleValidator(bottom, top, 10)
+    _validator.setLocale(QLocale.c())
+    return _validator
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -137,6 +168,38 @@ class MainWindow(QMainWindow):
 
         self.last_packet_time = None
 
+        # Smoothed FFT data, updated in-place when FFT smoothing is enabled.
+        self.fft_smoothed = None
+
+        # Station position (lat, lon, alt), parsed from the user position entries when they change.
+        # This is None if the entries could not be parsed.
+        self.station_position = None
+
+        # Horus UDP / OziMux output ports, parsed from their entries when they change.
+        # If an entry is invalid (e.g. while it is being edited), the last valid port is kept.
+        self.horus_udp_port = None
+        self.ozimux_udp_port = None
+
+        # Last FFT update read from the FFT processor.
+        self.fft_last_update = None
+
+        # Plot data waiting to be drawn by the plot update timer.
+        self.spectrum_plot_pending = None
+        self.snr_plot_pending = False
+
+        # Y axis ranges last applied to the spectrum and SNR plots.
+        self.spectrum_plot_yrange = None
+        self.snr_plot_yrange = None
+
+        # SNR history ring buffer. Every sample is written twice (at pos and pos+length),
+        # so the most recent samples can always be read as a contiguous, in-order view.
+        self.snr_history_time = np.zeros(SNR_HISTORY_LENGTH*2, dtype=np.float64)
+        self.snr_history_snr = np.zeros(SNR_HISTORY_LENGTH*2, dtype=np.float32)
+        self.snr_history_pos = 0
+        self.snr_history_count = 0
+        # Maximum SNR currently held in the history, used to scale the SNR plot.
+        self.snr_history_max = None
+
         # Rotator object
         self.rotator = None
         self.rotator_current_az = 0.0
@@ -156,13 +219,15 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"Horus Telemetry GUI - v{__version__}")
         self.setWindowIcon(getHorusIcon())
 
+        # Style for the group box titles. This is set once here, rather than on every group box.
+        self.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
+
         # Left Column VBox
         left_column = QVBoxLayout()
 
         # Controls
         w1_audio_groupbox = QGroupBox('Audio')
         w1_audio_groupbox.setObjectName("b1")
-        w1_audio_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w1_audio = QGridLayout(w1_audio_groupbox)
 
         # Audio Parameters
@@ -177,6 +242,7 @@ class MainWindow(QMainWindow):
 
         self.widgets["audioDbfsLabel"] = QLabel("<b>Input Level (dBFS):</b>")
         self.widgets["audioDbfsValue"] = QLabel("--")
+        self.widgets["audioDbfsValue"].setTextFormat(Qt.TextFormat.PlainText)
         self.widgets["audioDbfsValue_float"] = 0.0
 
         w1_audio.addWidget(self.widgets["audioDeviceLabel"], 0, 0, 1, 3)
@@ -190,7 +256,6 @@ class MainWindow(QMainWindow):
         # Modem Parameters
         w1_modem_groupbox = QGroupBox('Modem')
         w1_modem_groupbox.setObjectName("b1")
-        w1_modem_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w1_modem = QGridLayout(w1_modem_groupbox)
 
         self.widgets["horusModemLabel"] = QLabel("<b>Mode:</b>")
@@ -265,13 +330,19 @@ class MainWindow(QMainWindow):
         self.widgets["userLatEntry"] = QLineEdit("0.0")
         self.widgets["userLatEntry"].setToolTip("Station Latitude in Decimal Degrees, e.g. -34.123456")
         self.widgets["userLatEntry"].textEdited.connect(self.update_uploader_details)
+        self.widgets["userLatEntry"].setValidator(decimal_validator(-90.0, 90.0))
+        self.widgets["userLatEntry"].textChanged.connect(self.update_station_position)
         self.widgets["userLonEntry"] = QLineEdit("0.0")
         self.widgets["userLonEntry"].setToolTip("Station Longitude in Decimal Degrees, e.g. 138.123456")
         self.widgets["userLonEntry"].textEdited.connect(self.update_uploader_details)
+        self.widgets["userLonEntry"].setValidator(decimal_validator(-180.0, 180.0))
+        self.widgets["userLonEntry"].textChanged.connect(self.update_station_position)
         self.widgets["userAltitudeLabel"] = QLabel("<b>Altitude:</b>")
         self.widgets["userAltEntry"] = QLineEdit("0.0")
         self.widgets["userAltEntry"].setToolTip("Station Altitude in Metres Above Sea Level.")
         self.widgets["userAltEntry"].textEdited.connect(self.update_uploader_details)
+        self.widgets["userAltEntry"].setValidator(decimal_validator(-1000.0, 100000.0))
+        self.widgets["userAltEntry"].textChanged.connect(self.update_station_position)
         self.widgets["userAntennaLabel"] = QLabel("<b>Antenna:</b>")
         self.widgets["userAntennaEntry"] = QLineEdit("")
         self.widgets["userAntennaEntry"].setToolTip("A text description of your station's antenna.")
@@ -335,6 +406,8 @@ class MainWindow(QMainWindow):
         self.widgets["horusUDPLabel"] = QLabel("<b>Horus UDP Port:</b>")
         self.widgets["horusUDPEntry"] = QLineEdit("55672")
         self.widgets["horusUDPEntry"].setMaxLength(5)
+        self.widgets["horusUDPEntry"].setValidator(QIntValidator(1, 65535))
+        self.widgets["horusUDPEntry"].textChanged.connect(self.update_udp_ports)
         self.widgets["horusUDPEntry"].setToolTip(
             "UDP Port to output 'Horus UDP' JSON messages to."
         )
@@ -348,6 +421,8 @@ class MainWindow(QMainWindow):
         self.widgets["ozimuxUDPLabel"] = QLabel("<b>Ozimux UDP Port:</b>")
         self.widgets["ozimuxUDPEntry"] = QLineEdit("55683")
         self.widgets["ozimuxUDPEntry"].setMaxLength(5)
+        self.widgets["ozimuxUDPEntry"].setValidator(QIntValidator(1, 65535))
+        self.widgets["ozimuxUDPEntry"].textChanged.connect(self.update_udp_ports)
         self.widgets["ozimuxUDPEntry"].setToolTip(
             "UDP Port to output 'OziMux' UDP messages to."
         )
@@ -430,6 +505,7 @@ class MainWindow(QMainWindow):
         self.widgets["rotatorPortLabel"] = QLabel("<b>Rotator TCP/UDP Port:</b>")
         self.widgets["rotatorPortEntry"] = QLineEdit("4533")
         self.widgets["rotatorPortEntry"].setMaxLength(5)
+        self.widgets["rotatorPortEntry"].setValidator(QIntValidator(1, 65535))
         self.widgets["rotatorPortEntry"].setToolTip(
             "TCP (rotctld) or UDP (PSTRotator) port to connect to.\n"\
             "Default for rotctld: 4533\n"\
@@ -444,7 +520,8 @@ class MainWindow(QMainWindow):
             "transmitter in close vicinity of receiver."
         )
         self.widgets["rotatorThresholdLabel"] = QLabel("<b>Rotator Movement Threshold:</b>")
-        self.widgets["rotatorThresholdEntry"] = QLineEdit("2.5")
+        self.widgets["rotatorThresholdEntry"] = QLineEdit("0.5")
+        self.widgets["rotatorThresholdEntry"].setValidator(decimal_validator(0.0, 180.0))
         self.widgets["rotatorThresholdEntry"].setToolTip(
             "Only move if the angle between the payload position and \n"\
             "the current rotator position is more than this, in degrees."
@@ -468,8 +545,8 @@ class MainWindow(QMainWindow):
         w1_rotator.addWidget(self.widgets["rotatorHostEntry"], 2, 1, 1, 1)
         w1_rotator.addWidget(self.widgets["rotatorPortLabel"], 3, 0, 1, 1)
         w1_rotator.addWidget(self.widgets["rotatorPortEntry"], 3, 1, 1, 1)
-        #w1_rotator.addWidget(self.widgets["rotatorThresholdLabel"], 4, 0, 1, 1)
-        #w1_rotator.addWidget(self.widgets["rotatorThresholdEntry"], 4, 1, 1, 1)
+        w1_rotator.addWidget(self.widgets["rotatorThresholdLabel"], 4, 0, 1, 1)
+        w1_rotator.addWidget(self.widgets["rotatorThresholdEntry"], 4, 1, 1, 1)
         w1_rotator.addWidget(self.widgets["rotatorRangeInhibitLabel"], 5, 0, 1, 1)
         w1_rotator.addWidget(self.widgets["rotatorRangeInhibit"], 5, 1, 1, 1)
         w1_rotator.addWidget(self.widgets["rotatorConnectButton"], 6, 0, 1, 2)
@@ -497,38 +574,26 @@ class MainWindow(QMainWindow):
         # Right Column QGrid (Grid for merged cells)
         right_column = QGridLayout()
 
+        # Pen used for the spectrum and SNR plot lines
+        _plot_pen = pg.mkPen(width=PEN_WIDTH)
+
         # Spectrum Display
         self.widgets["spectrumPlot"] = pg.PlotWidget(title="Spectra")
         self.widgets["spectrumPlot"].setLabel("left", "Power (dB)")
         self.widgets["spectrumPlot"].setLabel("bottom", "Frequency (Hz)")
-        self.widgets["spectrumPlotData"] = self.widgets["spectrumPlot"].plot([0], pen=pg.mkPen(width=PEN_WIDTH))
+        # The FFT output is always finite, so pyqtgraph's (per-update) check for NaN/inf values can be skipped.
+        self.widgets["spectrumPlotData"] = self.widgets["spectrumPlot"].plot([0], pen=_plot_pen, skipFiniteCheck=True, antialias=False)
 
         # Frequency Estiator Outputs
+        _estimator_pen = pg.mkPen(color="grey", width=(PEN_WIDTH + 1), style=QtCore.Qt.PenStyle.DashLine)
         self.widgets["estimatorLines"] = [
             pg.InfiniteLine(
                 pos=-1000,
-                pen=pg.mkPen(color="grey", width=(PEN_WIDTH + 1), style=QtCore.Qt.PenStyle.DashLine),
-                label="F1",
-                labelOpts={'position':0.9}
-            ),
-            pg.InfiniteLine(
-                pos=-1000,
-                pen=pg.mkPen(color="grey", width=(PEN_WIDTH + 1), style=QtCore.Qt.PenStyle.DashLine),
-                label="F2",
-                labelOpts={'position':0.9}
-            ),
-            pg.InfiniteLine(
-                pos=-1000,
-                pen=pg.mkPen(color="grey", width=(PEN_WIDTH + 1), style=QtCore.Qt.PenStyle.DashLine),
-                label="F3",
+                pen=_estimator_pen,
+                label=f"F{_i+1}",
                 labelOpts={'position':0.9}
-            ),
-            pg.InfiniteLine(
-                pos=-1000,
-                pen=pg.mkPen(color="grey", width=(PEN_WIDTH + 1), style=QtCore.Qt.PenStyle.DashLine),
-                label="F4",
-                labelOpts={'position':0.9}
-            ),
+            )
+            for _i in range(4)
         ]
         for _line in self.widgets["estimatorLines"]:
             self.widgets["spectrumPlot"].addItem(_line)
@@ -546,7 +611,6 @@ class MainWindow(QMainWindow):
 
         w2_spectrum_groupbox = QGroupBox("Spectrum")
         w2_spectrum_groupbox.setObjectName("b1")
-        w2_spectrum_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         spectrum = QGridLayout(w2_spectrum_groupbox)
         spectrum.addWidget(self.widgets["spectrumPlot"])
 
@@ -554,7 +618,6 @@ class MainWindow(QMainWindow):
 
         w3_stats_groupbox = QGroupBox("SNR (dB)")
         w3_stats_groupbox.setObjectName("b1")
-        w3_stats_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w3_stats = QGridLayout(w3_stats_groupbox)
         self.widgets["snrBar"] = QProgressBar()
         self.widgets["snrBar"].setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -565,6 +628,7 @@ class MainWindow(QMainWindow):
         self.widgets["snrLabel"] = QLabel("--.-")
         self.widgets["snrLabel"].setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter);
         self.widgets["snrLabel"].setFont(QFont("Courier New", 14))
+        self.widgets["snrLabel"].setTextFormat(Qt.TextFormat.PlainText)
         w3_stats.addWidget(self.widgets["snrBar"], 0, 1, 1, 1)
         w3_stats.addWidget(self.widgets["snrLabel"], 1, 0, 1, 3)
         w3_stats.setColumnStretch(0, 2)
@@ -576,7 +640,6 @@ class MainWindow(QMainWindow):
         # SNR Plot
         w3_snr_groupbox = QGroupBox("SNR Plot")
         w3_snr_groupbox.setObjectName("b1")
-        w3_snr_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w3_snr = QGridLayout(w3_snr_groupbox)
         self.widgets["snrPlot"] = pg.PlotWidget(title="SNR")
         self.widgets["snrPlot"].setLabel("left", "SNR (dB)")
@@ -586,9 +649,7 @@ class MainWindow(QMainWindow):
         self.widgets["snrPlot"].setLimits(xMin=-60, xMax=0, yMin=-10, yMax=40)
         self.widgets["snrPlot"].showGrid(True, True)
         self.widgets["snrPlotRange"] = [-10, 30]
-        self.widgets["snrPlotTime"] = np.array([])
-        self.widgets["snrPlotSNR"] = np.array([])
-        self.widgets["snrPlotData"] = self.widgets["snrPlot"].plot(self.widgets["snrPlotTime"], self.widgets["snrPlotSNR"], pen=pg.mkPen(width=PEN_WIDTH))
+        self.widgets["snrPlotData"] = self.widgets["snrPlot"].plot([], [], pen=_plot_pen, antialias=False)
         w3_snr.addWidget(self.widgets["snrPlot"])
 
         w3_snr_groupbox.setLayout(w3_snr)
@@ -604,7 +665,6 @@ class MainWindow(QMainWindow):
         # Telemetry Data
         w4_data_groupbox = QGroupBox("Data")
         w4_data_groupbox.setObjectName("b1")
-        w4_data_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w4_data = QGridLayout(w4_data_groupbox)
         self.widgets["latestRawSentenceLabel"] = QLabel("<b>Latest Packet (Raw):</b>")
         self.widgets["latestRawSentenceData"] = QLineEdit("NO DATA")
@@ -625,33 +685,35 @@ class MainWindow(QMainWindow):
 
         w4_position_groupbox = QGroupBox("Position")
         w4_position_groupbox.setObjectName("b1")
-        w4_position_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w4_position = QGridLayout(w4_position_groupbox)
 
+        # Font used for the position and telemetry values
+        _value_font = QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold)
+
         self.widgets["latestPacketCallsignLabel"] = QLabel("<b>Callsign</b>")
         self.widgets["latestPacketCallsignValue"] = QLabel("---")
-        self.widgets["latestPacketCallsignValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketCallsignValue"].setFont(_value_font)
         self.widgets["latestPacketTimeLabel"] = QLabel("<b>Time</b>")
         self.widgets["latestPacketTimeValue"] = QLabel("---")
-        self.widgets["latestPacketTimeValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketTimeValue"].setFont(_value_font)
         self.widgets["latestPacketLatitudeLabel"] = QLabel("<b>Latitude</b>")
         self.widgets["latestPacketLatitudeValue"] = QLabel("---")
-        self.widgets["latestPacketLatitudeValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketLatitudeValue"].setFont(_value_font)
         self.widgets["latestPacketLongitudeLabel"] = QLabel("<b>Longitude</b>")
         self.widgets["latestPacketLongitudeValue"] = QLabel("---")
-        self.widgets["latestPacketLongitudeValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketLongitudeValue"].setFont(_value_font)
         self.widgets["latestPacketAltitudeLabel"] = QLabel("<b>Altitude</b>")
         self.widgets["latestPacketAltitudeValue"] = QLabel("---")
-        self.widgets["latestPacketAltitudeValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketAltitudeValue"].setFont(_value_font)
         self.widgets["latestPacketBearingLabel"] = QLabel("<b>Bearing</b>")
         self.widgets["latestPacketBearingValue"] = QLabel("---")
-        self.widgets["latestPacketBearingValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketBearingValue"].setFont(_value_font)
         self.widgets["latestPacketElevationLabel"] = QLabel("<b>Elevation</b>")
         self.widgets["latestPacketElevationValue"] = QLabel("---")
-        self.widgets["latestPacketElevationValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketElevationValue"].setFont(_value_font)
         self.widgets["latestPacketRangeLabel"] = QLabel("<b>Range (km)</b>")
         self.widgets["latestPacketRangeValue"] = QLabel("---")
-        self.widgets["latestPacketRangeValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestPacketRangeValue"].setFont(_value_font)
 
         w4_position.addWidget(self.widgets["latestPacketCallsignLabel"], 0, 0, 1, 2)
         w4_position.addWidget(self.widgets["latestPacketCallsignValue"], 1, 0, 1, 2)
@@ -675,20 +737,19 @@ class MainWindow(QMainWindow):
 
         w5_telemetry_groupbox = QGroupBox("Telemetry")
         w5_telemetry_groupbox.setObjectName("b1")
-        w5_telemetry_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         self.w5_telemetry = QGridLayout(w5_telemetry_groupbox)
         w5_telemetry_groupbox.setLayout(self.w5_telemetry)
 
         # These are placeholders and will be updated when telemetry is received. 
         self.widgets["latestTelemBattVoltageLabel"] = QLabel("<b>Batt Voltage</b>")
         self.widgets["latestTelemBattVoltageValue"] = QLabel("---")
-        self.widgets["latestTelemBattVoltageValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelemBattVoltageValue"].setFont(_value_font)
         self.widgets["latestTelemSatellitesLabel"] = QLabel("<b>Satellites</b>")
         self.widgets["latestTelemSatellitesValue"] = QLabel("---")
-        self.widgets["latestTelemSatellitesValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelemSatellitesValue"].setFont(_value_font)
         self.widgets["latestTelemTemperatureLabel"] = QLabel("<b>Temperature</b>")
         self.widgets["latestTelemTemperatureValue"] = QLabel("---")
-        self.widgets["latestTelemTemperatureValue"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelemTemperatureValue"].setFont(_value_font)
         
         self.w5_telemetry.addWidget(self.widgets[f"latestTelemBattVoltageLabel"], 0, 0, 1, 1)
         self.w5_telemetry.addWidget(self.widgets[f"latestTelemBattVoltageValue"], 1, 0, 1, 1)
@@ -699,22 +760,33 @@ class MainWindow(QMainWindow):
 
         self.widgets["latestTelem0Label"] = QLabel("<b>Ascent Rate</b>")
         self.widgets["latestTelem0Value"] = QLabel("---")
-        self.widgets["latestTelem0Value"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelem0Value"].setFont(_value_font)
         self.widgets["latestTelem1Label"] = QLabel("<b>External Temperature</b>")
         self.widgets["latestTelem1Value"] = QLabel("---")
-        self.widgets["latestTelem1Value"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelem1Value"].setFont(_value_font)
         self.widgets["latestTelem2Label"] = QLabel("<b>External Humidity</b>")
         self.widgets["latestTelem2Value"] = QLabel("---")
-        self.widgets["latestTelem2Value"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelem2Value"].setFont(_value_font)
         self.widgets["latestTelem3Label"] = QLabel("<b>External Pressure</b>")
         self.widgets["latestTelem3Value"] = QLabel("---")
-        self.widgets["latestTelem3Value"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+        self.widgets["latestTelem3Value"].setFont(_value_font)
         for i in range(4,9):
             self.widgets[f"latestTelem{i}Label"] = QLabel("")
             self.widgets[f"latestTelem{i}Value"] = QLabel("")
             self.widgets[f"latestTelem{i}Label"].hide()
             self.widgets[f"latestTelem{i}Value"].hide()
-            self.widgets[f"latestTelem{i}Value"].setFont(QFont("Courier New", POSITION_LABEL_FONT_SIZE, QFont.Weight.Bold))
+            self.widgets[f"latestTelem{i}Value"].setFont(_value_font)
+
+        # All position and telemetry value widgets, which are cleared when decoding starts.
+        self.packet_value_widgets = tuple(
+            _widget for _name, _widget in self.widgets.items()
+            if _name.startswith(("latestPacket", "latestTelem")) and _name.endswith("Value")
+        )
+
+        # Position and telemetry values are always plain text (and may contain strings from received packets),
+        # so don't check for rich text every time they are updated.
+        for _widget in self.packet_value_widgets:
+            _widget.setTextFormat(Qt.TextFormat.PlainText)
 
         for i in range(0,9):
             self.w5_telemetry.addWidget(self.widgets[f"latestTelem{i}Label"], 0, i+3, 1, 1)
@@ -730,7 +802,6 @@ class MainWindow(QMainWindow):
 
         w6_groupbox = QGroupBox("Log")
         w6_groupbox.setObjectName("b1")
-        w6_groupbox.setStyleSheet('QWidget#b1 { font-size: 15px; font-weight: bold}')
         w6 = QGridLayout(w6_groupbox)
         self.widgets["console"] = QPlainTextEdit()
         self.widgets["console"].setReadOnly(True)
@@ -779,6 +850,22 @@ class MainWindow(QMainWindow):
         # self.mainLayout.setColumnStretch(0, 1)
         # self.mainLayout.setColumnStretch(1, 10)
 
+        # Keep direct references to the widgets which are updated on every FFT / modem status update,
+        # to avoid repeated dictionary lookups in those handlers.
+        self.spectrum_plot = self.widgets["spectrumPlot"]
+        self.spectrum_plot_data = self.widgets["spectrumPlotData"]
+        self.spectrum_plot_range = self.widgets["spectrumPlotRange"]
+        self.snr_plot = self.widgets["snrPlot"]
+        self.snr_plot_data = self.widgets["snrPlotData"]
+        self.snr_plot_range = self.widgets["snrPlotRange"]
+        self.snr_bar = self.widgets["snrBar"]
+        self.snr_label = self.widgets["snrLabel"]
+        self.audio_dbfs_label = self.widgets["audioDbfsValue"]
+        self.fft_smoothing_selector = self.widgets["fftSmoothingSelector"]
+        self.estimator_lines = tuple(self.widgets["estimatorLines"])
+        # Custom telemetry field labels/values, indexed by column, for use when handling new packets.
+        self.telem_field_labels = tuple(self.widgets[f"latestTelem{_i}Label"] for _i in range(9))
+        self.telem_field_values = tuple(self.widgets[f"latestTelem{_i}Value"] for _i in range(9))
         # Resize window to final resolution, and display.
         logging.info("Starting GUI.")
         self.resize(1500, self.minimumSize().height())
@@ -797,17 +884,18 @@ class MainWindow(QMainWindow):
         if args.reset:
             logging.info("Clearing configuration.")
             write_config()
+            clear_list_caches()
         else:
             read_config(self.widgets)
 
+        # Make sure the cached station position and UDP ports reflect the loaded configuration.
+        self.update_station_position()
+        self.update_udp_ports()
 
-        try:
-            if float(self.widgets["userLatEntry"].text()) == 0.0 and float(self.widgets["userLonEntry"].text()) == 0.0:
-                _sondehub_user_pos = None
-            else:
-                _sondehub_user_pos = [float(self.widgets["userLatEntry"].text()), float(self.widgets["userLonEntry"].text()), 0.0]
-        except:
+        if self.station_position is None or (self.station_position[0] == 0.0 and self.station_position[1] == 0.0):
             _sondehub_user_pos = None
+        else:
+            _sondehub_user_pos = [self.station_position[0], self.station_position[1], 0.0]
 
         self.sondehub_uploader = SondehubAmateurUploader(
             upload_rate = 2,
@@ -829,9 +917,23 @@ class MainWindow(QMainWindow):
         self.payload_init_timer = QTimer()
         self.payload_init_timer.singleShot(100, self.payload_init)
 
+        # Redraw the spectrum and SNR plots at a fixed rate, using the latest available data.
+        self.plot_update_timer = QTimer()
+        self.plot_update_timer.timeout.connect(self.update_plots)
+        self.plot_update_timer.start(PLOT_UPDATE_INTERVAL)
+
+        # Timer to update the last packet age, started/stopped along with decoding.
+        self.decoded_age_timer = QTimer()
+        self.decoded_age_timer.timeout.connect(self.update_decoded_age)
+
         # Add console handler to top level logger.
-        console_handler = ConsoleHandler(self.handle_log_update)
-        logging.getLogger().addHandler(console_handler)
+        self.console_handler = ConsoleHandler()
+        logging.getLogger().addHandler(self.console_handler)
+
+        # Write out queued log messages to the console periodically, rather than on every message.
+        self.console_update_timer = QTimer()
+        self.console_update_timer.timeout.connect(self.update_console)
+        self.console_update_timer.start(CONSOLE_UPDATE_INTERVAL)
 
         logging.info("Started GUI.")
 
@@ -948,17 +1050,13 @@ class MainWindow(QMainWindow):
         self.sondehub_uploader.user_callsign = self.widgets["userCallEntry"].text()
         self.sondehub_uploader.user_radio = "Horus-GUI v" + __version__ + " " + self.widgets["userRadioEntry"].text()
         self.sondehub_uploader.user_antenna = self.widgets["userAntennaEntry"].text()
-        try:
-            if float(self.widgets["userLatEntry"].text()) == 0.0 and float(self.widgets["userLonEntry"].text()) == 0.0:
-                self.sondehub_uploader.user_position = None
-            else:
-                self.sondehub_uploader.user_position = [
-                    float(self.widgets["userLatEntry"].text()), 
-                    float(self.widgets["userLonEntry"].text()), 
-                    float(self.widgets["userAltEntry"].text())]
-        except Exception as e:
-            logging.error(f"Error parsing station location - {str(e)}")
+        if self.station_position is None:
+            logging.error("Error parsing station location - check the latitude, longitude and altitude entries.")
+            self.sondehub_uploader.user_position = None
+        elif self.station_position[0] == 0.0 and self.station_position[1] == 0.0:
             self.sondehub_uploader.user_position = None
+        else:
+            self.sondehub_uploader.user_position = list(self.station_position)
 
         if upload:
             self.sondehub_uploader.last_user_position_upload = 0
@@ -975,10 +1073,40 @@ class MainWindow(QMainWindow):
         self.widgets["sondehubPositionNotesLabel"].setText("<center><b>Station Info out of date - click Re-Upload!</b></center>")
 
 
+    def update_station_position(self):
+        """ Parse the station position entries, and cache the result for use when processing packets """
+        try:
+            self.station_position = (
+                float(self.widgets["userLatEntry"].text()),
+                float(self.widgets["userLonEntry"].text()),
+                float(self.widgets["userAltEntry"].text())
+            )
+        except ValueError:
+            self.station_position = None
+
+
+    def update_udp_ports(self):
+        """ Parse the UDP output port entries, and cache the result for use when processing packets """
+        self.horus_udp_port = self.parse_udp_port("horusUDPEntry", "Horus UDP", self.horus_udp_port)
+        self.ozimux_udp_port = self.parse_udp_port("ozimuxUDPEntry", "OziMux", self.ozimux_udp_port)
+
+
+    def parse_udp_port(self, entry, name, current_port):
+        """ Parse a UDP port entry. If the entry is not a valid port, the current port is returned. """
+        _entry = self.widgets[entry]
+
+        if _entry.hasAcceptableInput():
+            return int(_entry.text())
+
+        # This is called on every edit, so an empty entry while typing in a new port is normal.
+        logging.debug("%s - Invalid UDP port '%s', keeping port %s.", name, _entry.text(), current_port)
+        return current_port
+
+
     def habitat_inhibit(self):
         """ Update the Habitat inhibit flag """
         self.sondehub_uploader.inhibit = not self.widgets["sondehubUploadSelector"].isChecked()
-        logging.debug(f"Updated Sondebub Inhibit state: {self.sondehub_uploader.inhibit}")
+        logging.debug("Updated Sondebub Inhibit state: %s", self.sondehub_uploader.inhibit)
 
 
     def update_manual_estimator(self):
@@ -1020,24 +1148,27 @@ class MainWindow(QMainWindow):
         _data = data["fft"]
         _dbfs = data["dbfs"]
 
-        if self.widgets["fftSmoothingSelector"].isChecked():
+        if self.fft_smoothing_selector.isChecked():
             _tc = 0.25
-            _plot_data = (self.widgets["spectrumPlotData"].getData()[1] * (1 - _tc) + (_data * _tc))
-            self.widgets["spectrumPlotData"].setData(_scale, _plot_data)
+            if self.fft_smoothed is None or len(self.fft_smoothed) != len(_data):
+                # (Re)start the smoothing from the current FFT.
+                self.fft_smoothed = np.array(_data, dtype=np.float32)
+            else:
+                # Apply the IIR in-place on the stored smoothed data.
+                self.fft_smoothed *= (1 - _tc)
+                self.fft_smoothed += _data * _tc
+            self.spectrum_plot_pending = (_scale, self.fft_smoothed)
         else:
-            self.widgets["spectrumPlotData"].setData(_scale, _data)
+            self.fft_smoothed = None
+            self.spectrum_plot_pending = (_scale, _data)
 
         # Really basic IIR to smoothly adjust scale
-        _old_max = self.widgets["spectrumPlotRange"][1]
+        _old_max = self.spectrum_plot_range[1]
         _tc = 0.1
-        _new_max = float((_old_max * (1 - _tc)) + (np.max(_data) * _tc))
+        _new_max = (_old_max * (1 - _tc)) + (data["fft_max"] * _tc)
 
         # Store new max
-        self.widgets["spectrumPlotRange"][1] = max(self.widgets["spectrumPlotRange"][0], _new_max)
-
-        self.widgets["spectrumPlot"].setYRange(
-            self.widgets["spectrumPlotRange"][0], self.widgets["spectrumPlotRange"][1] + 20
-        )
+        self.spectrum_plot_range[1] = max(self.spectrum_plot_range[0], _new_max)
 
         # Ignore NaN values.
         if np.isnan(_dbfs) or np.isinf(_dbfs):
@@ -1057,7 +1188,7 @@ class MainWindow(QMainWindow):
         else:
             _dbfs_ok = "GOOD"
 
-        self.widgets["audioDbfsValue"].setText(f"{_new_dbfs:.0f}\t{_dbfs_ok}")
+        self.audio_dbfs_label.setText(f"{_new_dbfs:.0f}\t{_dbfs_ok}")
         self.widgets["audioDbfsValue_float"] = _new_dbfs
 
 
@@ -1067,38 +1198,100 @@ class MainWindow(QMainWindow):
         # Update Frequency estimator markers
         _fest_average = 0.0
         _fest_count = 0
-        for _i in range(len(status.extended_stats.f_est)):
-            _fest_pos = float(status.extended_stats.f_est[_i])
+        for _line, _fest in zip(self.estimator_lines, status.extended_stats.f_est):
+            _fest_pos = float(_fest)
             if _fest_pos != 0.0:
                 _fest_average += _fest_pos
                 _fest_count += 1
-                self.widgets["estimatorLines"][_i].setPos(_fest_pos)
+                # Only move the marker if it has changed, to avoid needlessly repainting the spectrum plot.
+                if _line.value() != _fest_pos:
+                    _line.setPos(_fest_pos)
 
         _fest_average = _fest_average/_fest_count
         self.widgets["fest_float"] = _fest_average
 
         # Update SNR Plot
         _time = time.time()
-        # Roll Time/SNR
-        self.widgets["snrPlotTime"] = np.append(self.widgets["snrPlotTime"], _time)
-        self.widgets["snrPlotSNR"] = np.append(self.widgets["snrPlotSNR"], float(status.snr))
-        if len(self.widgets["snrPlotTime"]) > 200:
-            self.widgets["snrPlotTime"] = self.widgets["snrPlotTime"][1:]
-            self.widgets["snrPlotSNR"] = self.widgets["snrPlotSNR"][1:]
-
-        # Plot new SNR data
-        self.widgets["snrPlotData"].setData((self.widgets["snrPlotTime"]-_time),  self.widgets["snrPlotSNR"])
-        _old_max = self.widgets["snrPlotRange"][1]
+        # Add Time/SNR to the history ring buffer
+        _snr = float(status.snr)
+        _pos = self.snr_history_pos
+        # Sample being overwritten, if the history is full.
+        _expired = self.snr_history_snr[_pos] if self.snr_history_count == SNR_HISTORY_LENGTH else None
+        self.snr_history_time[_pos] = self.snr_history_time[_pos + SNR_HISTORY_LENGTH] = _time
+        self.snr_history_snr[_pos] = self.snr_history_snr[_pos + SNR_HISTORY_LENGTH] = _snr
+        self.snr_history_pos = (_pos + 1) % SNR_HISTORY_LENGTH
+        self.snr_history_count = min(self.snr_history_count + 1, SNR_HISTORY_LENGTH)
+
+        # Update the maximum SNR. The whole history only needs to be searched if the maximum has just expired.
+        if self.snr_history_max is None or (_expired is not None and _expired >= self.snr_history_max):
+            self.snr_history_max = float(np.max(self.get_snr_history()[1]))
+        else:
+            self.snr_history_max = max(self.snr_history_max, float(self.snr_history_snr[_pos]))
+
+        # Flag new SNR data for plotting
+        self.snr_plot_pending = True
+        _old_max = self.snr_plot_range[1]
         _tc = 0.1
-        _new_max = float((_old_max * (1 - _tc)) + (np.max(self.widgets["snrPlotSNR"]) * _tc))
-        self.widgets["snrPlotRange"][1] = _new_max
-        self.widgets["snrPlot"].setYRange(
-            self.widgets["snrPlotRange"][0], _new_max+10 
-        )
+        _new_max = float((_old_max * (1 - _tc)) + (self.snr_history_max * _tc))
+        self.snr_plot_range[1] = _new_max
 
         # Update SNR bar and label
-        self.widgets["snrLabel"].setText(f"{float(status.snr):2.1f}")
-        self.widgets["snrBar"].setValue(int(status.snr))
+        self.snr_label.setText(f"{_snr:2.1f}")
+        self.snr_bar.setValue(int(status.snr))
+
+
+    def update_plots(self):
+        """ Draw any new spectrum or SNR data. Called from a timer, so multiple updates between redraws are coalesced. """
+
+        # Pick up the latest FFT result, if there is a new one.
+        if self.fft_process:
+            _update = self.fft_process.latest_update
+            if _update is not None and _update is not self.fft_last_update:
+                self.fft_last_update = _update
+                self.handle_fft_update(_update)
+
+        # Don't redraw anything while the window is minimised. Any pending data is kept, and drawn when it is restored.
+        if self.isMinimized():
+            return
+
+        if self.spectrum_plot_pending is not None and self.spectrum_plot.isVisible():
+            _scale, _data = self.spectrum_plot_pending
+            self.spectrum_plot_pending = None
+
+            self.spectrum_plot_data.setData(_scale, _data)
+
+            _yrange = (self.spectrum_plot_range[0], self.spectrum_plot_range[1] + 20)
+            if self.plot_range_changed(self.spectrum_plot_yrange, _yrange):
+                self.spectrum_plot.setYRange(*_yrange)
+                self.spectrum_plot_yrange = _yrange
+
+        if self.snr_plot_pending and self.snr_plot.isVisible():
+            self.snr_plot_pending = False
+
+            _snr_time, _snr = self.get_snr_history()
+            self.snr_plot_data.setData((_snr_time - _snr_time[-1]),  _snr)
+
+            _yrange = (self.snr_plot_range[0], self.snr_plot_range[1] + 10)
+            if self.plot_range_changed(self.snr_plot_yrange, _yrange):
+                self.snr_plot.setYRange(*_yrange)
+                self.snr_plot_yrange = _yrange
+
+
+    def plot_range_changed(self, old_range, new_range, threshold=0.5):
+        """ Check if a plot axis range has changed enough (in dB) to be worth re-applying """
+        if old_range is None:
+            return True
+
+        return abs(new_range[0] - old_range[0]) >= threshold or abs(new_range[1] - old_range[1]) >= threshold
+
+
+    def get_snr_history(self, count=None):
+        """ Return views of the most recent (time, SNR) history, oldest first """
+        if count is None or count > self.snr_history_count:
+            count = self.snr_history_count
+
+        _end = self.snr_history_pos + SNR_HISTORY_LENGTH
+        return (self.snr_history_time[_end - count:_end], self.snr_history_snr[_end - count:_end])
 
 
     def get_latest_snr(self):
@@ -1114,10 +1307,7 @@ class MainWindow(QMainWindow):
             # For Horus Binary we can use a smaller lookback time
             _snr_lookback = _snr_update_rate * 4
         
-        if len(self.widgets["snrPlotSNR"])>_snr_lookback:
-            return np.max(self.widgets["snrPlotSNR"][-1*_snr_lookback:])
-        else:
-            return np.max(self.widgets["snrPlotSNR"])
+        return float(np.max(self.get_snr_history(_snr_lookback)[1]))
 
     def handle_new_packet_emit(self, frame):
         self.new_packet_signal.info.emit(frame)
@@ -1243,10 +1433,10 @@ class MainWindow(QMainWindow):
                     column = 0
                     for field in _decoded['custom_field_names']:
                         field_nice = field.replace('_', ' ').title()
-                        self.widgets[f"latestTelem{column}Label"].setText(f"<b>{field_nice}</b>")
-                        self.widgets[f"latestTelem{column}Value"].setText(f"{_decoded[field]}")
-                        self.widgets[f"latestTelem{column}Label"].show()
-                        self.widgets[f"latestTelem{column}Value"].show()
+                        self.telem_field_labels[column].setText(f"<b>{field_nice}</b>")
+                        self.telem_field_values[column].setText(f"{_decoded[field]}")
+                        self.telem_field_labels[column].show()
+                        self.telem_field_values[column].show()
 
                         self.w5_telemetry.setColumnStretch((column + 3), 10)
 
@@ -1255,19 +1445,17 @@ class MainWindow(QMainWindow):
                     # Hide remaining columns
                     if column < 8:
                         for i in range(column, 9):
-                            self.widgets[f"latestTelem{column}Label"].hide()
-                            self.widgets[f"latestTelem{column}Value"].hide()
+                            self.telem_field_labels[i].hide()
+                            self.telem_field_values[i].hide()
                             self.w5_telemetry.setColumnStretch((i + 3), 1)
 
                 # Attempt to update the range/elevation/bearing fields.
                 try:
-                    _station_lat = float(self.widgets["userLatEntry"].text())
-                    _station_lon = float(self.widgets["userLonEntry"].text())
-                    _station_alt = float(self.widgets["userAltEntry"].text())
+                    _station_position = self.station_position
 
-                    if (_station_lat != 0.0) or (_station_lon != 0.0):
+                    if _station_position and ((_station_position[0] != 0.0) or (_station_position[1] != 0.0)):
                         _position_info = position_info(
-                            (_station_lat, _station_lon, _station_alt),
+                            _station_position,
                             (_decoded['latitude'], _decoded['longitude'], _decoded['altitude'])
                         )
 
@@ -1282,8 +1470,9 @@ class MainWindow(QMainWindow):
 
                         if self.rotator and not ( _decoded['latitude'] == 0.0 and _decoded['longitude'] == 0.0 ) and not _range_inhibit:
                             try:
-                                self.rotator.set_azel(_position_info['bearing'], _position_info['elevation'], check_response=False)
-                                self.widgets["rotatorCurrentPositionValue"].setText(f"{_position_info['bearing']:3.1f}˚,  {_position_info['elevation']:2.1f}˚")
+                                # Only update the commanded position if a move was actually sent.
+                                if self.rotator.set_azel(_position_info['bearing'], _position_info['elevation'], check_response=False):
+                                    self.widgets["rotatorCurrentPositionValue"].setText(f"{_position_info['bearing']:3.1f}˚,  {_position_info['elevation']:2.1f}˚")
                             except Exception as e:
                                 logging.error("Rotator - Error setting Position: " + str(e))
                         
@@ -1291,30 +1480,23 @@ class MainWindow(QMainWindow):
                     logging.error(f"Could not calculate relative position to payload - {str(e)}")
                 
                 # Send data out via Horus UDP
-                if self.widgets["horusUploadSelector"].isChecked():
-                    _udp_port = int(self.widgets["horusUDPEntry"].text())
-                    # Add in SNR data
-                    try:
-                        _snr = float(self.widgets["snrLabel"].text())
-                    except ValueError as e:
-                        logging.error(e)
-                        _snr = 0
-                    _decoded['snr'] = _snr
+                if self.widgets["horusUploadSelector"].isChecked() and self.horus_udp_port:
+                    # Add in the latest SNR value
+                    if self.snr_history_count > 0:
+                        _decoded['snr'] = round(float(self.get_snr_history(1)[1][0]), 1)
+                    else:
+                        _decoded['snr'] = 0
 
-                    send_payload_summary(_decoded, port=_udp_port)
+                    send_payload_summary(_decoded, port=self.horus_udp_port)
                 
                 # Send data out via OziMux messaging
-                if self.widgets["ozimuxUploadSelector"].isChecked():
-                    _udp_port = int(self.widgets["ozimuxUDPEntry"].text())
-                    send_ozimux_message(_decoded, port=_udp_port)
+                if self.widgets["ozimuxUploadSelector"].isChecked() and self.ozimux_udp_port:
+                    send_ozimux_message(_decoded, port=self.ozimux_udp_port)
 
                 # Log telemetry
                 if self.telemetry_logger:
                     self.telemetry_logger.add(_decoded)
 
-        # Try and force a refresh of the displays.
-        QApplication.processEvents()
-
 
 
     def start_decoding(self):
@@ -1366,21 +1548,8 @@ class MainWindow(QMainWindow):
             # Reset data fields
             self.widgets["latestRawSentenceData"].setText("NO DATA")
             self.widgets["latestDecodedSentenceData"].setText("NO DATA")
-            self.widgets["latestPacketCallsignValue"].setText("---")
-            self.widgets["latestPacketTimeValue"].setText("---")
-            self.widgets["latestPacketLatitudeValue"].setText("---")
-            self.widgets["latestPacketLongitudeValue"].setText("---")
-            self.widgets["latestPacketAltitudeValue"].setText("---")
-            self.widgets["latestPacketElevationValue"].setText("---")
-            self.widgets["latestPacketBearingValue"].setText("---")
-            self.widgets["latestPacketRangeValue"].setText("---")
-
-            self.widgets["latestTelemBattVoltageValue"].setText("---")
-            self.widgets["latestTelemSatellitesValue"].setText("---")
-            self.widgets["latestTelemTemperatureValue"].setText("---")
-            
-            for column in range(0,9):
-                self.widgets[f"latestTelem{column}Value"].setText(f"---")
+            for _value in self.packet_value_widgets:
+                _value.setText("---")
 
             # Ensure the SondeHub upload is set correctly.
             self.sondehub_uploader.inhibit = not self.widgets["sondehubUploadSelector"].isChecked()
@@ -1395,11 +1564,11 @@ class MainWindow(QMainWindow):
                 fs=_sample_rate, 
             )
 
-            # Create FFT Processor worker thread
+            # Create FFT Processor worker thread.
+            # FFT results are polled by the plot update timer rather than sent via a signal.
             worker = Worker(self.fft_process.processing_thread)
             # worker.signals.result.connect(self.null_thread_complete)
             # worker.signals.finished.connect(self.null_thread_complete)
-            worker.signals.info.connect(self.handle_fft_update)
 
             self.threadpool.start(worker)
 
@@ -1457,13 +1626,8 @@ class MainWindow(QMainWindow):
             self.running = True
             logging.info("Started Audio Processing.")
 
-            # Start thread to update the last packet age
-            worker = Worker(self.decoded_age_thread)
-            # worker.signals.result.connect(self.null_thread_complete)
-            # worker.signals.finished.connect(self.null_thread_complete)
-            worker.signals.info.connect(self.handle_decoded_age_update)
-
-            self.threadpool.start(worker)
+            # Start updating the last packet age
+            self.decoded_age_timer.start(DECODED_AGE_UPDATE_INTERVAL)
 
             # Grey out some selectors, so the user cannot adjust them while we are decoding.
             self.widgets["audioDeviceSelector"].setEnabled(False)
@@ -1493,6 +1657,7 @@ class MainWindow(QMainWindow):
 
             self.widgets["startDecodeButton"].setText("Start")
             self.running = False
+            self.decoded_age_timer.stop()
 
             logging.info("Stopped Audio Processing.")
             
@@ -1504,6 +1669,17 @@ class MainWindow(QMainWindow):
             self.widgets["horusMaskEstimatorSelector"].setEnabled(True)
             self.widgets["horusMaskSpacingEntry"].setEnabled(True)
 
+    def update_console(self):
+        """ Write any queued log messages to the console, as a single update """
+        _messages = self.console_handler.messages
+        _lines = []
+        while _messages:
+            _lines.append(_messages.popleft())
+
+        if _lines:
+            self.handle_log_update("\n".join(_lines))
+
+
     def handle_log_update(self, log_update):
         self.widgets["console"].appendPlainText(log_update)
         # Make sure the scroll bar is right at the bottom.
@@ -1520,20 +1696,13 @@ class MainWindow(QMainWindow):
         # Once initialised, enable the start button
         self.widgets["startDecodeButton"].setEnabled(True)
 
-    # Thread to update last packet age
-    def decoded_age_thread(self, info_callback):
-        while self.running:
-            if self.last_packet_time != None:
-                _time_delta = int(time.time() - self.last_packet_time)
-                _time_delta_seconds = int(_time_delta%60)
-                _time_delta_minutes = int((_time_delta/60) % 60)
-                _time_delta_hours = int((_time_delta/3600))
-                info_callback.emit(f"{_time_delta_hours:02d}:{_time_delta_minutes:02d}:{_time_delta_seconds:02d}")
-
-            time.sleep(0.5)
-
-    def handle_decoded_age_update(self, text):
-        self.widgets['latestDecodedAgeData'].setText(text)
+    # Update last packet age. Called from a timer while decoding.
+    def update_decoded_age(self):
+        if self.last_packet_time != None:
+            _time_delta = int(time.time() - self.last_packet_time)
+            _time_delta_hours, _time_delta = divmod(_time_delta, 3600)
+            _time_delta_minutes, _time_delta_seconds = divmod(_time_delta, 60)
+            self.widgets['latestDecodedAgeData'].setText(f"{_time_delta_hours:02d}:{_time_delta_minutes:02d}:{_time_delta_seconds:02d}")
 
     # Rotator Control
     def startstop_rotator(self):
@@ -1608,22 +1777,32 @@ class MainWindow(QMainWindow):
         return
 
 class ConsoleHandler(logging.Handler):
-    """ Logging handler to write to the GUI console """
+    """ Logging handler to write to the GUI console. Messages are queued, and written out by a timer in the GUI thread. """
 
-    def __init__(self, callback):
+    def __init__(self, max_messages=1000):
         logging.Handler.__init__(self)
-        self.signaller = WorkerSignals()
-        self.signaller.info.connect(callback)
+        # Appending/popping from a deque is thread-safe, so this can be written from any thread.
+        self.messages = deque(maxlen=max_messages)
+
+        # Timestamp string for the most recent second a record was logged in.
+        self.last_second = None
+        self.last_timestamp = ""
 
     def emit(self, record):
-        _time = datetime.datetime.now()
-        _text = f"{_time.strftime('%H:%M:%S')} [{record.levelname}]  {record.msg}"
-        
-        # TODO -- create gentle dismount when exiting
         try:
-            self.signaller.info.emit(_text)
-        except:
-            pass
+            # Use the record's own creation time, and only re-format it when the second changes.
+            # emit() is called with the handler lock held, so this cache is safe across threads.
+            _second = int(record.created)
+            if _second != self.last_second:
+                self.last_timestamp = time.strftime("%H:%M:%S", time.localtime(_second))
+                self.last_second = _second
+
+            _text = f"{self.last_timestamp} [{record.levelname}]  {record.getMessage()}"
+
+            self.messages.append(_text)
+        except Exception:
+            # Don't let a badly formed log message propagate back into the caller.
+            self.handleError(record)
 
 # Main
 def main():
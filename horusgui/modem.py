@@ -50,9 +50,8 @@ def init_horus_modem(widgets):
     # Clear modem list.
     widgets["horusModemSelector"].clear()
 
-    # Add items from modem list
-    for _modem in HORUS_MODEM_LIST:
-        widgets["horusModemSelector"].addItem(_modem)
+    # Add items from modem list, in a single insertion.
+    widgets["horusModemSelector"].addItems(list(HORUS_MODEM_LIST))
 
     # Select default modem
     widgets["horusModemSelector"].setCurrentText(DEFAULT_MODEM)
@@ -69,8 +68,7 @@ def populate_modem_settings(widgets):
     widgets["horusModemRateSelector"].clear()
 
     # Populate
-    for _rate in HORUS_MODEM_LIST[_current_modem]["baud_rates"]:
-        widgets["horusModemRateSelector"].addItem(str(_rate))
+    widgets["horusModemRateSelector"].addItems([str(_rate) for _rate in HORUS_MODEM_LIST[_current_modem]["baud_rates"]])
 
     # Select default rate.
     widgets["horusModemRateSelector"].setCurrentText(
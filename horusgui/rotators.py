@@ -11,6 +11,20 @@ import logging
 import traceback
 # from threading import Thread
 
+
+def angle_difference(a, b):
+    """ Return the absolute difference between two angles, in degrees, accounting for wrap-around """
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+def move_below_threshold(azimuth, elevation, last_azimuth, last_elevation, threshold):
+    """ Check if a move from the last commanded position is too small to be worth sending to the rotator """
+    if last_azimuth is None:
+        return False
+
+    return (angle_difference(azimuth, last_azimuth) < threshold) and (abs(elevation - last_elevation) < threshold)
+
+
 class ROTCTLD(object):
     """ rotctld (hamlib) communication class """
     # Note: This is a massive hack. 
@@ -22,6 +36,11 @@ class ROTCTLD(object):
 
         self.hostname = hostname
         self.port = port
+        self.threshold = threshold
+
+        # Last commanded position, used to avoid sending moves smaller than the threshold.
+        self.last_azimuth = None
+        self.last_elevation = None
 
 
     def connect(self):
@@ -60,7 +79,7 @@ class ROTCTLD(object):
         return model
 
     def set_azel(self,azimuth,elevation, check_response=False):
-        """ Command rotator to a particular azimuth/elevation """
+        """ Command rotator to a particular azimuth/elevation. Returns False if the move was skipped or not accepted. """
         # Sanity check inputs.
         if elevation > 90.0:
             elevation = 90.0
@@ -70,10 +89,15 @@ class ROTCTLD(object):
         if azimuth > 360.0:
             azimuth = azimuth % 360.0
 
+        # Don't bother the rotator with moves smaller than the threshold.
+        if move_below_threshold(azimuth, elevation, self.last_azimuth, self.last_elevation, self.threshold):
+            return False
 
         command = "P %3.1f %2.1f" % (azimuth,elevation)
         response = self.send_command(command, check_response=check_response)
         if "RPRT 0" in response:
+            self.last_azimuth = azimuth
+            self.last_elevation = elevation
             return True
         else:
             return False
@@ -110,8 +134,13 @@ class PSTRotator(object):
         self.hostname = hostname
         self.port = port
         self.poll_rate = poll_rate
+        self.threshold = threshold
         self.azel_thread_running = True
 
+        # Last commanded position, used to avoid sending moves smaller than the threshold.
+        self.last_azimuth = None
+        self.last_elevation = None
+
         # self.t_rx = Thread(target=self.azel_rx_loop)
         # self.t_rx.start()
 
@@ -123,7 +152,7 @@ class PSTRotator(object):
         self.azel_thread_running = False
 
     def set_azel(self,azimuth,elevation, check_response=False):
-        """ Send an Azimuth/Elevation move command to PSTRotator """
+        """ Send an Azimuth/Elevation move command to PSTRotator. Returns False if the move was skipped. """
 
         # Sanity check inputs.
         if elevation > 90.0:
@@ -134,14 +163,21 @@ class PSTRotator(object):
         if azimuth > 360.0:
             azimuth = azimuth % 360.0
 
+        # Don't bother the rotator with moves smaller than the threshold.
+        if move_below_threshold(azimuth, elevation, self.last_azimuth, self.last_elevation, self.threshold):
+            return False
+
         # Generate command
         pst_command = "<PST><TRACK>0</TRACK><AZIMUTH>%.1f</AZIMUTH><ELEVATION>%.1f</ELEVATION></PST>" % (azimuth,elevation)
-        logging.debug("Sent command: %s" % pst_command)
+        logging.debug("Sent command: %s", pst_command)
         # Send!
         udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         udp_socket.sendto(pst_command.encode('ascii'), (self.hostname,self.port))
         udp_socket.close()
 
+        self.last_azimuth = azimuth
+        self.last_elevation = elevation
+
         return True
 
     def poll_azel(self):
@@ -177,7 +213,7 @@ class PSTRotator(object):
             
             if m != None:
                 # Attempt to parse Azimuth / Elevation
-                logging.debug("Received: %s" % m[0])
+                logging.debug("Received: %s", m[0])
 
                 data = m[0].decode('ascii')
                 if data[:2] == 'EL':
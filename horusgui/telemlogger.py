@@ -4,9 +4,8 @@ import datetime
 import json
 import logging
 import os.path
-import time
 from threading import Thread
-from queue import Queue
+from queue import SimpleQueue, Empty
 
 
 class TelemetryLogger(object):
@@ -28,16 +27,49 @@ class TelemetryLogger(object):
 
         self.log_directory_updated = False
 
-        self.input_queue = Queue()
+        self.input_queue = SimpleQueue()
         self.json_filenames = {}
         self.csv_filenames = {}
 
+        # Currently open log files, keyed by path. These are kept open between batches of telemetry,
+        # and only closed when the log directory or format changes, or the logger is closed.
+        self.open_files = {}
+        self.open_files_format = None
+
         self.processing_running = True
 
         self.processing_thread = Thread(target=self.process_telemetry)
         self.processing_thread.start()
 
 
+    def get_log_file(self, filepath):
+        """ Open a log file for appending, re-using it if it is already open """
+        if filepath not in self.open_files:
+            self.open_files[filepath] = open(filepath, 'a')
+
+        return self.open_files[filepath]
+
+
+    def flush_log_files(self):
+        """ Flush all open log files, so everything written so far is on disk """
+        for _filepath, _f in self.open_files.items():
+            try:
+                _f.flush()
+            except Exception as e:
+                logging.error(f"Telemetry Logger - Could not flush log file {_filepath} - {str(e)}")
+
+
+    def close_log_files(self):
+        """ Close all open log files """
+        for _filepath, _f in self.open_files.items():
+            try:
+                _f.close()
+            except Exception as e:
+                logging.error(f"Telemetry Logger - Could not close log file {_filepath} - {str(e)}")
+
+        self.open_files = {}
+
+
     def write_json(self, telemetry):
 
         # Remove detailed packet format information if it exists.
@@ -49,7 +81,7 @@ class TelemetryLogger(object):
             _filepath = os.path.join(self.log_directory, _filename)
 
             try:
-                _current_f = open(_filepath, 'a')
+                _current_f = self.get_log_file(_filepath)
                 self.json_filenames[telemetry['callsign']] = _filepath
                 logging.info(f"Telemetry Logger - Opened new log file: {_filepath}")
 
@@ -61,7 +93,7 @@ class TelemetryLogger(object):
         else:
             # Open the file we already have started writing to.
             try:
-                _current_f = open(self.json_filenames[telemetry['callsign']], 'a')
+                _current_f = self.get_log_file(self.json_filenames[telemetry['callsign']])
             except Exception as e:
                 # Couldn't open log file. Remove filename from local list so we try and make a new file on next telemetry.
                 logging.error(f"Telemetry Logger - Could not open existing log file {self.json_filenames[telemetry['callsign']]}.")
@@ -70,10 +102,8 @@ class TelemetryLogger(object):
 
         # Convert telemetry to JSON
         _data = json.dumps(telemetry) + "\n"
-        # Write to file.
+        # Write to file. This is flushed once the current batch of telemetry has been written.
         _current_f.write(_data)
-        # Close file.
-        _current_f.close()
 
 
     def write_csv(self, telemetry):
@@ -106,7 +136,7 @@ class TelemetryLogger(object):
             _filepath = os.path.join(self.log_directory, _filename)
 
             try:
-                _current_f = open(_filepath, 'a')
+                _current_f = self.get_log_file(_filepath)
                 self.csv_filenames[telemetry['callsign']] = _filepath
                 logging.info(f"Telemetry Logger - Opened new log file: {_filepath}")
 
@@ -121,7 +151,7 @@ class TelemetryLogger(object):
         else:
             # Open the file we already have started writing to.
             try:
-                _current_f = open(self.csv_filenames[telemetry['callsign']], 'a')
+                _current_f = self.get_log_file(self.csv_filenames[telemetry['callsign']])
             except Exception as e:
                 # Couldn't open log file. Remove filename from local list so we try and make a new file on next telemetry.
                 logging.error(f"Telemetry Logger - Could not open existing log file {self.csv_filenames[telemetry['callsign']]}.")
@@ -130,8 +160,6 @@ class TelemetryLogger(object):
 
         fc = csv.DictWriter(_current_f, fieldnames=csv_keys)
         fc.writerows([telemetry])
-        # Close file.
-        _current_f.close()
 
 
     def handle_telemetry(self, telemetry):
@@ -140,10 +168,16 @@ class TelemetryLogger(object):
             return
 
         if self.log_directory_updated:
-            # Log directory has been moved, clear out existing filenames.
+            # Log directory has been moved, close and clear out existing files.
+            self.close_log_files()
             self.json_filenames = {}
             self.csv_filenames = {}
             self.log_directory_updated = False
+
+        if self.log_format != self.open_files_format:
+            # Log format has changed, so the open files will not be written to again.
+            self.close_log_files()
+            self.open_files_format = self.log_format
         
         if self.log_format == "JSON":
             self.write_json(telemetry)
@@ -157,15 +191,27 @@ class TelemetryLogger(object):
         logging.debug("Started Telemetry Logger Thread")
         
         while self.processing_running:
+            # Wait for telemetry to arrive, waking up periodically to check if we need to exit.
+            try:
+                _telemetry = self.input_queue.get(timeout=1)
+            except Empty:
+                continue
 
-            while self.input_queue.qsize() > 0:
+            # Write out everything that is queued, then flush the (still open) log files once for the batch.
+            while _telemetry is not None:
                 try:
-                    self.handle_telemetry(self.input_queue.get())
+                    self.handle_telemetry(_telemetry)
                 except Exception as e:
                     logging.error(f"Telemetry Logger - Error handling telemetry - {str(e)}")
 
-            time.sleep(1)
+                try:
+                    _telemetry = self.input_queue.get_nowait()
+                except Empty:
+                    _telemetry = None
+
+            self.flush_log_files()
 
+        self.close_log_files()
         logging.debug("Closed Telemetry Logger Thread")
 
     def add(self, telemetry):
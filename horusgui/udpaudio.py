@@ -41,16 +41,23 @@ class UDPStream(object):
             pass
     
         self.s.bind(('127.0.0.1',self.udp_port))
+
+        # Receive into a single, re-used buffer. The FFT and modem both copy the samples they are given,
+        # so there is no need to allocate a new bytes object for every packet.
+        _buffer = bytearray(65535)
+        _view = memoryview(_buffer)
+
         while self.listen_thread_running:
             try:
-                m = self.s.recvfrom(65535)
+                _length = self.s.recv_into(_buffer)
             except socket.timeout:
-                m = None
+                _length = 0
             except:
+                _length = 0
                 traceback.print_exc()
             
-            if m != None:
-                self.handle_samples(m[0], len(m[0])//2)
+            if _length > 0:
+                self.handle_samples(_view[:_length], _length//2)
 
         self.s.close()
 